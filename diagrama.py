@@ -1,49 +1,79 @@
 import os
+import sys
 import datetime
-from typing import List, Dict, Optional
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import List, Dict, Optional, Set, Tuple, ValuesView
 
+# Chave de ordenação por quantidade, implementada em C
+_por_quantidade = attrgetter('quantidade')
+
+# Campos do produto exibidos em cada linha do relatório de vendas
+_campos_linha_venda = attrgetter('nome', 'tamanho', 'cor', 'preco')
+
+# Sequência ANSI que limpa o terminal e posiciona o cursor no início
+LIMPAR_TELA = '\033[2J\033[H'
+
+@dataclass(slots=True, eq=False)
 class Produto:
     """
     Classe que representa um produto da loja de roupas.
     """
-    def __init__(self, id: int, nome: str, tamanho: str, cor: str, quantidade: int, preco: float, limite_minimo: int = 5):
-        self.id = id
-        self.nome = nome
-        self.tamanho = tamanho
-        self.cor = cor
-        self.quantidade = quantidade
-        self.preco = preco
-        self.limite_minimo = limite_minimo
+    id: int
+    nome: str
+    tamanho: str
+    cor: str
+    quantidade: int
+    preco: float
+    limite_minimo: int = 5
+    # Representação em texto já formatada; quem alterar um campo exibido deve
+    # chamar _invalidar_str (Estoque faz isso em todas as suas alterações)
+    _str_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def __str__(self) -> str:
-        return f"ID: {self.id} | {self.nome} | Tamanho: {self.tamanho} | Cor: {self.cor} | Quantidade: {self.quantidade} | Preço: R${self.preco:.2f}"
+        if self._str_cache is None:
+            self._str_cache = f"ID: {self.id} | {self.nome} | Tamanho: {self.tamanho} | Cor: {self.cor} | Quantidade: {self.quantidade} | Preço: R${self.preco:.2f}"
+        return self._str_cache
+
+    def _invalidar_str(self) -> None:
+        """Descarta a representação em texto armazenada."""
+        self._str_cache = None
 
-    def atualizar_quantidade(self, quantidade: int) -> None:
-        """Atualiza a quantidade do produto no estoque."""
+    def atualizar_quantidade(self, quantidade: int) -> int:
+        """Atualiza a quantidade do produto no estoque e retorna a nova quantidade."""
         self.quantidade += quantidade
+        self._invalidar_str()
+        return self.quantidade
 
     def verificar_estoque_baixo(self) -> bool:
         """Verifica se o produto está com estoque baixo."""
         return self.quantidade < self.limite_minimo
 
 
+@dataclass(slots=True, eq=False)
 class Venda:
     """
     Classe que representa uma venda realizada na loja.
+    A data não deve ser alterada após a criação: sua forma formatada é
+    calculada uma única vez em __post_init__.
     """
-    def __init__(self, id: int, produtos: Dict[int, int], data: datetime.datetime = None):
-        self.id = id
-        self.produtos = produtos  # Dicionário com {id_produto: quantidade}
-        self.data = data if data else datetime.datetime.now()
-        self.valor_total = 0.0
+    id: int
+    produtos: Dict[int, int]  # Dicionário com {id_produto: quantidade}
+    valor_total: float
+    data: Optional[datetime.datetime] = None
+    # Data já formatada para exibição, calculada uma única vez (não acompanha
+    # alterações posteriores em data)
+    _data_fmt: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not self.data:
+            self.data = datetime.datetime.now()
+        self._data_fmt = self.data.strftime('%d/%m/%Y %H:%M')
 
     def __str__(self) -> str:
-        return f"Venda #{self.id} | Data: {self.data.strftime('%d/%m/%Y %H:%M')} | Valor: R${self.valor_total:.2f}"
-
-    def calcular_valor_total(self, produtos: Dict[int, Produto]) -> None:
-        """Calcula o valor total da venda."""
-        self.valor_total = sum(produtos[id_produto].preco * quantidade 
-                           for id_produto, quantidade in self.produtos.items())
+        return f"Venda #{self.id} | Data: {self._data_fmt} | Valor: R${self.valor_total:.2f}"
 
 
 class Estoque:
@@ -53,14 +83,41 @@ class Estoque:
     def __init__(self):
         self.produtos: Dict[int, Produto] = {}
         self.vendas: List[Venda] = []
+        # Datas das vendas, em paralelo a self.vendas; ambas mantidas em ordem cronológica
+        self._datas_vendas: List[datetime.datetime] = []
         self.ultimo_id_produto = 0
         self.ultimo_id_venda = 0
+        # Índice dos IDs de produtos com estoque baixo, mantido a cada alteração
+        self._estoque_baixo: Set[int] = set()
+        # Pares (nome, id) mantidos em ordem para o relatório de estoque, e o nome
+        # com que cada produto foi indexado (os campos de Produto podem mudar por fora)
+        self._por_nome: List[Tuple[str, int]] = []
+        self._nomes_indexados: Dict[int, str] = {}
+
+    def _reindexar_estoque_baixo(self, produto: Produto) -> None:
+        """Atualiza o índice de estoque baixo para o produto informado."""
+        if produto.verificar_estoque_baixo():
+            self._estoque_baixo.add(produto.id)
+        else:
+            self._estoque_baixo.discard(produto.id)
+
+    def _indexar_nome(self, produto: Produto) -> None:
+        """Insere o produto no índice ordenado por nome."""
+        self._nomes_indexados[produto.id] = produto.nome
+        insort(self._por_nome, (produto.nome, produto.id))
+
+    def _remover_indice_nome(self, id_produto: int) -> None:
+        """Remove o produto do índice ordenado por nome, usando o nome indexado."""
+        nome = self._nomes_indexados.pop(id_produto)
+        del self._por_nome[bisect_left(self._por_nome, (nome, id_produto))]
 
     def adicionar_produto(self, nome: str, tamanho: str, cor: str, quantidade: int, preco: float, limite_minimo: int = 5) -> Produto:
         """Adiciona um novo produto ao estoque."""
         self.ultimo_id_produto += 1
         produto = Produto(self.ultimo_id_produto, nome, tamanho, cor, quantidade, preco, limite_minimo)
         self.produtos[self.ultimo_id_produto] = produto
+        self._reindexar_estoque_baixo(produto)
+        self._indexar_nome(produto)
         return produto
 
     def atualizar_produto(self, id_produto: int, nome: str = None, tamanho: str = None, 
@@ -74,6 +131,9 @@ class Estoque:
         
         if nome:
             produto.nome = nome
+        if produto.nome != self._nomes_indexados[id_produto]:
+            self._remover_indice_nome(id_produto)
+            self._indexar_nome(produto)
         if tamanho:
             produto.tamanho = tamanho
         if cor:
@@ -84,6 +144,9 @@ class Estoque:
             produto.preco = preco
         if limite_minimo is not None:
             produto.limite_minimo = limite_minimo
+        if quantidade is not None or limite_minimo is not None:
+            self._reindexar_estoque_baixo(produto)
+        produto._invalidar_str()
             
         return produto
 
@@ -91,87 +154,159 @@ class Estoque:
         """Remove um produto do estoque."""
         if id_produto in self.produtos:
             del self.produtos[id_produto]
+            self._remover_indice_nome(id_produto)
+            self._estoque_baixo.discard(id_produto)
             return True
         return False
 
-    def registrar_venda(self, produtos_vendidos: Dict[int, int]) -> Optional[Venda]:
+    def _validar_itens(self, itens: Dict[int, int]) -> bool:
+        """Verifica se todos os produtos existem e têm quantidade suficiente."""
+        produtos = self.produtos
+        for id_produto, quantidade in itens.items():
+            produto = produtos.get(id_produto)
+            if produto is None:
+                print(f"Erro: Produto com ID {id_produto} não existe.")
+                return False
+            if quantidade <= 0:
+                print(f"Erro: Quantidade inválida ({quantidade}) para {produto.nome}.")
+                return False
+            if produto.quantidade < quantidade:
+                print(f"Erro: Produto {produto.nome} tem apenas {produto.quantidade} unidades em estoque.")
+                return False
+        return True
+
+    def _efetivar_venda(self, produtos_vendidos: Dict[int, int], alertas: Dict[int, Produto]) -> Venda:
         """
-        Registra uma nova venda.
-        O parâmetro produtos_vendidos é um dicionário com {id_produto: quantidade}
+        Baixa o estoque e cria a venda, supondo os itens já validados.
+        Os produtos que ficarem com estoque baixo são acumulados em alertas.
         """
-        # Verifica se todos os produtos existem e têm quantidade suficiente
+        # Atualiza o estoque e calcula o valor total em uma única passagem
+        produtos = self.produtos
+        valor_total = 0.0
+        marcar_estoque_baixo = self._estoque_baixo.add
         for id_produto, quantidade in produtos_vendidos.items():
-            if id_produto not in self.produtos:
-                print(f"Erro: Produto com ID {id_produto} não existe.")
-                return None
-            if self.produtos[id_produto].quantidade < quantidade:
-                print(f"Erro: Produto {self.produtos[id_produto].nome} tem apenas {self.produtos[id_produto].quantidade} unidades em estoque.")
-                return None
-        
-        # Atualiza o estoque
-        for id_produto, quantidade in produtos_vendidos.items():
-            self.produtos[id_produto].atualizar_quantidade(-quantidade)
-            
-            # Verifica se o estoque ficou baixo
-            if self.produtos[id_produto].verificar_estoque_baixo():
-                print(f"ALERTA: Estoque baixo para {self.produtos[id_produto].nome} (Quantidade: {self.produtos[id_produto].quantidade})")
+            produto = produtos[id_produto]
+            produto.quantidade -= quantidade
+            produto._invalidar_str()
+            valor_total += produto.preco * quantidade
+            if produto.quantidade < produto.limite_minimo:
+                marcar_estoque_baixo(id_produto)
+                alertas[id_produto] = produto
         
         # Cria a venda
         self.ultimo_id_venda += 1
-        venda = Venda(self.ultimo_id_venda, produtos_vendidos)
-        venda.calcular_valor_total(self.produtos)
-        self.vendas.append(venda)
+        venda = Venda(self.ultimo_id_venda, produtos_vendidos, valor_total)
+        datas = self._datas_vendas
+        if datas and venda.data < datas[-1]:
+            # O relógio voltou (ajuste de NTP ou horário de verão): insere a venda na
+            # posição cronológica para manter as datas ordenadas para o bisect
+            posicao = bisect_right(datas, venda.data)
+            datas.insert(posicao, venda.data)
+            self.vendas.insert(posicao, venda)
+        else:
+            datas.append(venda.data)
+            self.vendas.append(venda)
         
         return venda
 
-    def listar_produtos(self) -> List[Produto]:
-        """Retorna a lista de todos os produtos no estoque."""
-        return list(self.produtos.values())
+    def _exibir_alertas(self, alertas: Dict[int, Produto]) -> None:
+        """Exibe um alerta por produto que ficou com estoque baixo."""
+        for produto in alertas.values():
+            print(f"ALERTA: Estoque baixo para {produto.nome} (Quantidade: {produto.quantidade})")
 
-    def listar_produtos_estoque_baixo(self) -> List[Produto]:
-        """Retorna a lista de produtos com estoque baixo."""
-        return [produto for produto in self.produtos.values() if produto.verificar_estoque_baixo()]
+    def registrar_venda(self, produtos_vendidos: Dict[int, int]) -> Optional[Venda]:
+        """
+        Registra uma nova venda.
+        O parâmetro produtos_vendidos é um dicionário com {id_produto: quantidade}
+        """
+        if not self._validar_itens(produtos_vendidos):
+            return None
+        alertas: Dict[int, Produto] = {}
+        venda = self._efetivar_venda(produtos_vendidos, alertas)
+        self._exibir_alertas(alertas)
+        return venda
 
-    def gerar_relatorio_estoque(self) -> str:
-        """Gera um relatório do estoque atual."""
-        relatorio = "===== RELATÓRIO DE ESTOQUE =====\n"
-        relatorio += f"Data: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}\n"
-        relatorio += f"Total de produtos: {len(self.produtos)}\n\n"
+    def registrar_vendas_em_lote(self, carrinhos: List[Dict[int, int]]) -> Optional[List[Venda]]:
+        """
+        Registra várias vendas de uma vez (importação em lote).
+        A validação considera a soma das quantidades de todos os carrinhos:
+        se algum produto não tiver estoque suficiente, nenhuma venda é registrada.
+        """
+        # Cada carrinho é validado isoladamente (quantidades positivas) antes da
+        # soma, para que uma linha negativa não compense excesso em outro carrinho
+        demanda: Counter[int] = Counter()
+        for carrinho in carrinhos:
+            if not self._validar_itens(carrinho):
+                return None
+            demanda.update(carrinho)
         
-        for produto in sorted(self.produtos.values(), key=lambda p: p.nome):
+        if not self._validar_itens(demanda):
+            return None
+        # Os alertas são acumulados no lote todo e exibidos uma vez por produto
+        alertas: Dict[int, Produto] = {}
+        vendas = [self._efetivar_venda(carrinho, alertas) for carrinho in carrinhos]
+        self._exibir_alertas(alertas)
+        return vendas
+
+    def listar_produtos(self) -> ValuesView[Produto]:
+        """Retorna uma visão de todos os produtos no estoque, sem copiá-los."""
+        return self.produtos.values()
+
+    def listar_produtos_estoque_baixo(self) -> List[Produto]:
+        """Retorna a lista de produtos com estoque baixo."""
+        return [self.produtos[id_produto] for id_produto in sorted(self._estoque_baixo)]
+
+    def gerar_relatorio_estoque(self, data: datetime.datetime = None) -> str:
+        """Gera um relatório do estoque atual, datado com a data informada (ou a atual)."""
+        if data is None:
+            data = datetime.datetime.now()
+        partes = ["===== RELATÓRIO DE ESTOQUE =====\n",
+                  f"Data: {data.strftime('%d/%m/%Y %H:%M')}\n",
+                  f"Total de produtos: {len(self.produtos)}\n\n"]
+        
+        produtos = self.produtos
+        adicionar = partes.append
+        for _, id_produto in self._por_nome:
+            produto = produtos[id_produto]
             status = "ESTOQUE BAIXO" if produto.verificar_estoque_baixo() else "OK"
-            relatorio += f"{produto} | Status: {status}\n"
+            adicionar(f"{produto} | Status: {status}\n")
             
-        return relatorio
+        return "".join(partes)
 
     def gerar_relatorio_vendas(self, data_inicio: datetime.datetime = None, data_fim: datetime.datetime = None) -> str:
         """Gera um relatório de vendas no período especificado."""
+        periodo_inicio = data_inicio.strftime('%d/%m/%Y') if data_inicio else 'Início'
+        periodo_fim = data_fim.strftime('%d/%m/%Y') if data_fim else 'Hoje'
         if data_inicio is None:
             data_inicio = datetime.datetime.min
         if data_fim is None:
             data_fim = datetime.datetime.max
             
-        vendas_periodo = [venda for venda in self.vendas 
-                          if data_inicio <= venda.data <= data_fim]
-        
-        relatorio = "===== RELATÓRIO DE VENDAS =====\n"
-        relatorio += f"Período: {data_inicio.strftime('%d/%m/%Y') if data_inicio != datetime.datetime.min else 'Início'} "
-        relatorio += f"a {data_fim.strftime('%d/%m/%Y') if data_fim != datetime.datetime.max else 'Hoje'}\n"
-        relatorio += f"Total de vendas: {len(vendas_periodo)}\n"
-        relatorio += f"Valor total: R${sum(venda.valor_total for venda in vendas_periodo):.2f}\n\n"
-        
+        # As vendas são mantidas em ordem cronológica (ver _efetivar_venda), então
+        # o período corresponde a uma fatia contínua da lista
+        inicio = bisect_left(self._datas_vendas, data_inicio)
+        fim = bisect_right(self._datas_vendas, data_fim)
+        vendas_periodo = self.vendas[inicio:fim]
+        
+        partes = ["===== RELATÓRIO DE VENDAS =====\n",
+                  f"Período: {periodo_inicio} a {periodo_fim}\n",
+                  f"Total de vendas: {len(vendas_periodo)}\n",
+                  f"Valor total: R${sum(venda.valor_total for venda in vendas_periodo):.2f}\n\n"]
+        
+        produtos = self.produtos
+        adicionar = partes.append
         for venda in vendas_periodo:
-            relatorio += f"{venda}\n"
-            relatorio += "Produtos vendidos:\n"
+            adicionar(f"{venda}\nProdutos vendidos:\n")
             for id_produto, quantidade in venda.produtos.items():
-                if id_produto in self.produtos:
-                    produto = self.produtos[id_produto]
-                    relatorio += f"  - {quantidade}x {produto.nome} (Tamanho: {produto.tamanho}, Cor: {produto.cor}) - R${produto.preco:.2f} cada\n"
+                produto = produtos.get(id_produto)
+                if produto is not None:
+                    nome, tamanho, cor, preco = _campos_linha_venda(produto)
+                    adicionar(f"  - {quantidade}x {nome} (Tamanho: {tamanho}, Cor: {cor}) - R${preco:.2f} cada\n")
                 else:
-                    relatorio += f"  - {quantidade}x Produto ID {id_produto} (não encontrado no estoque atual)\n"
-            relatorio += "\n"
+                    adicionar(f"  - {quantidade}x Produto ID {id_produto} (não encontrado no estoque atual)\n")
+            adicionar("\n")
             
-        return relatorio
+        return "".join(partes)
 
 
 class Interface:
@@ -209,7 +344,11 @@ class Interface:
 
     def exibir_menu(self):
         """Exibe o menu principal."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if os.name == 'nt':
+            os.system('cls')
+        else:
+            sys.stdout.write(LIMPAR_TELA)
+            sys.stdout.flush()
         print("===== SISTEMA DE GESTÃO DE ESTOQUE - LOJA DE ROUPAS =====")
         print("1. Cadastrar Produto")
         print("2. Atualizar Produto")
@@ -233,6 +372,40 @@ class Interface:
                 print("Opção inválida!")
                 input("Pressione Enter para continuar...")
 
+    def _ler_inteiro(self, prompt: str, padrao: int = None, minimo: int = 1) -> int:
+        """
+        Lê um número inteiro maior ou igual a minimo, repetindo até ser válido.
+        Se padrao for informado, uma entrada vazia retorna esse valor.
+        """
+        while True:
+            entrada = input(prompt)
+            if not entrada and padrao is not None:
+                return padrao
+            try:
+                valor = int(entrada)
+                if valor >= minimo:
+                    return valor
+            except ValueError:
+                pass
+            print(f"Valor inválido. Digite um número inteiro maior ou igual a {minimo}.")
+
+    def _ler_float_positivo(self, prompt: str, padrao: float = None) -> float:
+        """
+        Lê um número maior que zero, repetindo até ser válido.
+        Se padrao for informado, uma entrada vazia retorna esse valor.
+        """
+        while True:
+            entrada = input(prompt)
+            if not entrada and padrao is not None:
+                return padrao
+            try:
+                valor = float(entrada)
+                if valor > 0:
+                    return valor
+            except ValueError:
+                pass
+            print("Valor inválido. Digite um número maior que zero.")
+
     def cadastrar_produto(self):
         """Cadastra um novo produto."""
         print("\n===== CADASTRAR PRODUTO =====")
@@ -240,31 +413,9 @@ class Interface:
         tamanho = input("Tamanho: ")
         cor = input("Cor: ")
         
-        quantidade = 0
-        while quantidade <= 0:
-            try:
-                quantidade = int(input("Quantidade: "))
-                if quantidade <= 0:
-                    print("A quantidade deve ser maior que zero.")
-            except ValueError:
-                print("Valor inválido. Digite um número inteiro.")
-        
-        preco = 0
-        while preco <= 0:
-            try:
-                preco = float(input("Preço: R$"))
-                if preco <= 0:
-                    print("O preço deve ser maior que zero.")
-            except ValueError:
-                print("Valor inválido. Digite um número.")
-        
-        limite_minimo = 5
-        try:
-            limite = input("Limite mínimo para alerta de estoque [5]: ")
-            if limite:
-                limite_minimo = int(limite)
-        except ValueError:
-            print("Valor inválido. Usando o valor padrão (5).")
+        quantidade = self._ler_inteiro("Quantidade: ")
+        preco = self._ler_float_positivo("Preço: R$")
+        limite_minimo = self._ler_inteiro("Limite mínimo para alerta de estoque [5]: ", padrao=5, minimo=0)
         
         produto = self.estoque.adicionar_produto(nome, tamanho, cor, quantidade, preco, limite_minimo)
         print(f"\nProduto cadastrado com sucesso: {produto}")
@@ -289,38 +440,12 @@ class Interface:
             tamanho = input(f"Tamanho [{produto.tamanho}]: ")
             cor = input(f"Cor [{produto.cor}]: ")
             
-            quantidade = None
-            qtd_input = input(f"Quantidade [{produto.quantidade}]: ")
-            if qtd_input:
-                try:
-                    quantidade = int(qtd_input)
-                    if quantidade < 0:
-                        print("A quantidade não pode ser negativa. Mantendo o valor atual.")
-                        quantidade = None
-                except ValueError:
-                    print("Valor inválido. Mantendo o valor atual.")
-            
-            preco = None
-            preco_input = input(f"Preço [R${produto.preco:.2f}]: ")
-            if preco_input:
-                try:
-                    preco = float(preco_input)
-                    if preco <= 0:
-                        print("O preço deve ser maior que zero. Mantendo o valor atual.")
-                        preco = None
-                except ValueError:
-                    print("Valor inválido. Mantendo o valor atual.")
-            
-            limite_minimo = None
-            limite_input = input(f"Limite mínimo para alerta de estoque [{produto.limite_minimo}]: ")
-            if limite_input:
-                try:
-                    limite_minimo = int(limite_input)
-                    if limite_minimo < 0:
-                        print("O limite não pode ser negativo. Mantendo o valor atual.")
-                        limite_minimo = None
-                except ValueError:
-                    print("Valor inválido. Mantendo o valor atual.")
+            # Entradas vazias mantêm o valor atual
+            quantidade = self._ler_inteiro(f"Quantidade [{produto.quantidade}]: ",
+                                           padrao=produto.quantidade, minimo=0)
+            preco = self._ler_float_positivo(f"Preço [R${produto.preco:.2f}]: ", padrao=produto.preco)
+            limite_minimo = self._ler_inteiro(f"Limite mínimo para alerta de estoque [{produto.limite_minimo}]: ",
+                                              padrao=produto.limite_minimo, minimo=0)
             
             produto = self.estoque.atualizar_produto(
                 id_produto, 
@@ -365,7 +490,8 @@ class Interface:
         if not produtos:
             print("Nenhum produto cadastrado.")
         else:
-            for produto in sorted(produtos, key=lambda p: p.id):
+            # Os IDs são crescentes, então a ordem de inserção já é a ordem por ID
+            for produto in produtos:
                 status = "ESTOQUE BAIXO" if produto.verificar_estoque_baixo() else "OK"
                 print(f"{produto} | Status: {status}")
         
@@ -377,7 +503,7 @@ class Interface:
         print("\n===== REGISTRAR VENDA =====")
         self.listar_produtos(pausar=False)
         
-        produtos_vendidos = {}
+        produtos_vendidos: Counter[int] = Counter()
         
         while True:
             try:
@@ -395,23 +521,13 @@ class Interface:
                 produto = self.estoque.produtos[id_produto]
                 print(f"Selecionado: {produto.nome} | Tamanho: {produto.tamanho} | Cor: {produto.cor} | Preço: R${produto.preco:.2f}")
                 
-                quantidade = 0
-                while quantidade <= 0 or quantidade > produto.quantidade:
-                    try:
-                        quantidade = int(input(f"Quantidade (disponível: {produto.quantidade}): "))
-                        
-                        if quantidade <= 0:
-                            print("A quantidade deve ser maior que zero.")
-                        elif quantidade > produto.quantidade:
-                            print(f"Quantidade insuficiente em estoque. Disponível: {produto.quantidade}")
-                            
-                    except ValueError:
-                        print("Valor inválido. Digite um número inteiro.")
+                prompt_quantidade = f"Quantidade (disponível: {produto.quantidade}): "
+                quantidade = self._ler_inteiro(prompt_quantidade)
+                while quantidade > produto.quantidade:
+                    print(f"Quantidade insuficiente em estoque. Disponível: {produto.quantidade}")
+                    quantidade = self._ler_inteiro(prompt_quantidade)
                 
-                if id_produto in produtos_vendidos:
-                    produtos_vendidos[id_produto] += quantidade
-                else:
-                    produtos_vendidos[id_produto] = quantidade
+                produtos_vendidos[id_produto] += quantidade
                     
                 print(f"{quantidade}x {produto.nome} adicionado à venda.")
                 
@@ -455,20 +571,21 @@ class Interface:
         if not produtos:
             print("Não há produtos com estoque baixo.")
         else:
-            for produto in sorted(produtos, key=lambda p: p.quantidade):
+            for produto in sorted(produtos, key=_por_quantidade):
                 print(f"{produto} | ALERTA: Estoque Baixo!")
                 
         input("\nPressione Enter para continuar...")
 
     def gerar_relatorio_estoque(self):
         """Gera e exibe um relatório do estoque atual."""
-        relatorio = self.estoque.gerar_relatorio_estoque()
+        agora = datetime.datetime.now()
+        relatorio = self.estoque.gerar_relatorio_estoque(agora)
         print("\n" + relatorio)
         
         salvar = input("\nDeseja salvar o relatório em arquivo? (S/N): ").strip().upper()
         
         if salvar == 'S':
-            nome_arquivo = f"relatorio_estoque_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+            nome_arquivo = f"relatorio_estoque_{agora.strftime('%Y%m%d_%H%M%S')}.txt"
             with open(nome_arquivo, 'w', encoding='utf-8') as arquivo:
                 arquivo.write(relatorio)
             print(f"Relatório salvo como '{nome_arquivo}'")